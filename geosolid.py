@@ -4,13 +4,31 @@ import warnings
 warnings.filterwarnings("ignore")
 
 import os
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import trimesh
+import shapely
 import ezdxf
 from ezdxf.gfxattribs import GfxAttribs
-from shapely import MultiPolygon, Polygon
+from mapbox_earcut import triangulate_float64
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from shapely import Polygon, STRtree
+from shapely.affinity import translate
 from shapely.ops import unary_union
 import json
 
+try:
+    import ijson  # streaming parser for large geojson files
+except ImportError:
+    ijson = None
+
+try:
+    from orjson import loads as json_loads  # fast parser for line-delimited and not streamed geojson files
+except ImportError:
+    json_loads = json.loads
+
 parser = argparse.ArgumentParser(description="geojson polygon layer to 3D model dxf converter tool")
 
 # inputs
@@ -27,6 +45,8 @@ parser.add_argument("-s", "--simplify_tolerance", metavar='', type=float, defaul
                     help="float number of simplify ratio, default is 0.1", required=False)
 parser.add_argument("-n", "--normalize", metavar='', type=lambda x: x.lower() == "true", default=True,
                     help="normalize polygons, default is True", required=False)
+parser.add_argument("-w", "--workers", metavar='', type=int, default=os.cpu_count() or 1,
+                    help="number of processes for mesh generation, default is number of cpu cores", required=False)
 args = parser.parse_args()
 
 # params
@@ -37,222 +57,318 @@ output_type = args.output_type
 buffer_tolerance = args.buffer_tolerance
 simplify_tolerance = args.simplify_tolerance
 normalize = args.normalize
+workers = args.workers
 
 # outputs
 file_folder = os.path.dirname(in_file)
-out_file = os.path.join(file_folder, os.path.basename(in_file).replace('.geojson', '.dxf').replace('.json', '.dxf'))
+out_file = os.path.join(file_folder, os.path.splitext(os.path.basename(in_file))[0] + '.dxf')
 
 # constants
 DEFAULT_HEIGHT = 3.0  # default height for extruded meshes
 SCALE_FACTOR = 1.0  # scale factor for normalizing polygons, default is 1.0
-SHIFTS = [
-    (0.0, 0.0, 0.0),
-    (0.1, 0.0, 0.0),
-    (-0.1, 0.1, 0.0),
-    (-0.1, 0.0, 0.0),
-    (0.1, -0.1, 0.0),
-]  # distances to move meshes in order to combine them with existing ones
+SHIFT_DISTANCE = 0.1  # distance to move meshes in order to combine them with existing ones
+SHIFT_ATTEMPTS = 4  # number of moved meshes union attempts after a failed union of unmoved ones
+SHIFT_SEED = 0  # seed of random moves, same for every cluster to get reproducible results
+LINE_DELIMITED_EXTENSIONS = ('.geojsonl', '.geojsons')  # newline-delimited geojson, a feature per line
+DXF_PRECISION = 6  # number of decimals of vertex coordinates written to dxf
+UNION_CHUNK_SIZE = 500  # minimal number of polygons united at once in cascaded union
 MAIN_LAYER = GfxAttribs(layer="all", color=252)  # main layer in output cad file
 ERRORS_LAYER = GfxAttribs(layer="errors", color=80)  # errors layer for corrupted meshes
 
 
-def extract_all_coords(geojson_data):
-    # get all coordinates from a whole layer
+def read_features(file):
+    # yield geojson features one by one without loading a whole layer into memory
 
-    all_coords = []
-    for feature in geojson_data:
-        geom = feature["geometry"]
-        if geom["type"] == "Polygon":
-            for ring in geom["coordinates"]:
-                all_coords.extend(ring)
-        elif geom["type"] == "MultiPolygon":
-            for polygon in geom["coordinates"]:
-                for ring in polygon:
-                    all_coords.extend(ring)
+    with open(file, 'rb') as geodata:
+        if file.lower().endswith(LINE_DELIMITED_EXTENSIONS):
+            for line in geodata:
+                # lines of geojson text sequences may start with a record separator
+                line = line.strip(b'\x1e \t\r\n')
+                if line:
+                    yield json_loads(line)
+        elif ijson:
+            yield from ijson.items(geodata, 'features.item', use_float=True)
+        else:
+            yield from json_loads(geodata.read())['features']
 
-    return all_coords
 
+def cascade_union(geoms):
+    # unite geometries by chunks and then unite partial results, much faster than one call for large layers
 
-def data_collection(file):
-    # step 1, collect polygon parts as shapely polygons with height values from geojson
+    geoms = list(geoms)
+    chunk = max(UNION_CHUNK_SIZE, math.isqrt(len(geoms)))
+    parts = [unary_union(geoms[i:i + chunk]) for i in range(0, len(geoms), chunk)]
+    if len(parts) == 1:
+        return parts[0]
+    return unary_union(parts)
+
+
+def components_union(polygons, tree):
+    # unite polygons by groups of intersecting ones, groups do not touch each other so their unions
+    # are simply collected into a multipolygon
+
+    # connected components of a graph where intersecting polygons found with spatial index are linked
+    pairs = tree.query(polygons, predicate='intersects')
+    graph = coo_matrix((np.ones(pairs.shape[1], dtype=np.int8), (pairs[0], pairs[1])),
+                       shape=(len(polygons), len(polygons)))
+    _, labels = connected_components(graph, directed=False)
 
-    dict_polygons = {}
-    with open(file, 'r', encoding='utf-8') as geodata:
-        data = json.load(geodata)
+    # polygon indices grouped by component, single polygons are taken as they are
+    order = np.argsort(labels, kind='stable')
+    groups = np.split(order, np.cumsum(np.bincount(labels))[:-1])
+    united = [polygons[group[0]] if len(group) == 1 else cascade_union(polygons[group]) for group in groups]
+    return shapely.multipolygons(shapely.get_parts(united))
 
-    all_coords = extract_all_coords(data['features'])
-    min_x = min(point[0] for point in all_coords)
-    min_y = min(point[1] for point in all_coords)
-    min_corner = (min_x, min_y)
 
-    for i_row, row in enumerate(data['features']):
+def is_ccw(coords):
+    # orientation of a closed ring by the sign of its shoelace area
+
+    return np.sum((coords[1:, 0] - coords[:-1, 0]) * (coords[1:, 1] + coords[:-1, 1])) < 0
+
+
+def data_collection(file):
+    # step 1, collect polygon parts as shapely polygons with height values from geojson
+    # returns arrays of polygons, heights and z-levels aligned by index
+
+    # single pass over the layer: collect raw parts with attributes and find the extent corner
+    raw_parts = []
+    heights = []
+    z_levels = []
+    min_corner = np.full(2, np.inf)
+    for row in read_features(file):
         geom = row['geometry']
         coordinates = geom['coordinates']
         properties = row['properties']
-        for i_part, part in enumerate(coordinates):
-            coords_main = []
-            coords_holes = []
-
-            # check for lakes
-            for i_ring, ring in enumerate(part):
-                holes = []
-                for coor in ring:
-                    if not i_ring:
-                        if normalize:
-                            coords_main.append(
-                                ((coor[0] - min_corner[0]) * SCALE_FACTOR, (coor[1] - min_corner[1]) * SCALE_FACTOR))
-                        else:
-                            coords_main.append((coor[0], coor[1]))
-                    else:
-                        if normalize:
-                            holes.append(
-                                ((coor[0] - min_corner[0]) * SCALE_FACTOR, (coor[1] - min_corner[1]) * SCALE_FACTOR))
-                        else:
-                            holes.append((coor[0], coor[1]))
-                coords_holes.append(holes)
-
-            # create main polygon (outline)
-            p_main = Polygon(coords_main, holes=[])
-
-            # add lakes if exist
-            for index_hole, hole in enumerate(coords_holes):
-                p_hole = Polygon(hole, holes=[])
-                if p_hole.exterior.is_ccw:
-                    coords_holes[index_hole] = hole[::-1]
-
-            # fix polygon, switch to clockwise
-            if not p_main.exterior.is_ccw:
-                p = Polygon(coords_main[::-1], holes=coords_holes)
-            else:
-                p = Polygon(coords_main, holes=coords_holes)
+        if geom['type'] == 'Polygon':
+            coordinates = [coordinates]
 
-            # get height from specified field, convert it to float if attribute is string
-            # set default height if it is not specified or negative
-            hgt = properties.get(height_field, DEFAULT_HEIGHT)
-            if isinstance(hgt, str):
-                hgt = float(hgt) if hgt else DEFAULT_HEIGHT
+        # get height from specified field, convert it to float if attribute is string
+        # set default height if it is not specified or negative
+        hgt = properties.get(height_field, DEFAULT_HEIGHT)
+        if isinstance(hgt, str):
+            hgt = float(hgt) if hgt else DEFAULT_HEIGHT
 
-            if not hgt or hgt <= 0.0:
-                hgt = DEFAULT_HEIGHT
+        if not hgt or hgt <= 0.0:
+            hgt = DEFAULT_HEIGHT
 
-            # get building zlevel
-            hgt_zlev = 0
-            if z_level_field:
-                hgt_zlev = properties.get(z_level_field, 0)
+        # get building zlevel, convert it to float if attribute is string
+        hgt_zlev = 0.0
+        if z_level_field:
+            hgt_zlev = float(properties.get(z_level_field) or 0.0)
 
-            # creating dicts like {polygon: height_meters, zlevel}
-            dict_polygons[p] = [hgt, hgt_zlev]
-    return dict_polygons
+        for part in coordinates:
+            # rings as arrays of x, y (possible z values are dropped)
+            rings = [np.asarray(ring, dtype=np.float64)[:, :2] for ring in part]
+            np.minimum(min_corner, np.concatenate(rings).min(axis=0), out=min_corner)
+            raw_parts.append(rings)
+            heights.append(hgt)
+            z_levels.append(hgt_zlev)
 
+    polygons = []
+    for rings in raw_parts:
+        # shift and scale all ring coordinates at once
+        if normalize:
+            rings = [(ring_arr - min_corner) * SCALE_FACTOR for ring_arr in rings]
 
-def transform_to_mesh(polygon_data):
+        # first ring is outline, the others are lakes
+        # fix rings orientation: counterclockwise outline, clockwise lakes
+        coords_main = rings[0] if is_ccw(rings[0]) else rings[0][::-1]
+        coords_holes = [hole[::-1] if is_ccw(hole) else hole for hole in rings[1:]]
+
+        # create polygon with lakes
+        polygons.append(Polygon(coords_main, holes=coords_holes))
+
+    return np.array(polygons, dtype=object), np.array(heights, dtype=np.float64), np.array(z_levels, dtype=np.float64)
+
+
+def transform_to_mesh(polygons, heights, z_levels):
     # step 2, convert polygons to meshes
 
     list_of_meshes = []
     list_of_broken_meshes = []
 
-    # all done in order to avoid thin lines and other trashy geometries
-    # 2.1 combining all shapes into a single multipolygon
-    merged = unary_union(list(polygon_data.keys()))
+    # shapely array functions release the GIL, so cutters are made in a thread along with the steps below
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cutters_future = executor.submit(make_cutters, polygons)
 
-    # squared buffer of multipolygon
-    buffer_plus = merged.buffer(buffer_tolerance, cap_style='square', join_style='mitre')
+        # spatial index of initial geometries, used for finding groups of polygons to unite
+        # and for testing each buffer part only against nearby polygons
+        tree = STRtree(polygons)
 
-    # convert result above to multipolygon is it is singlepart
-    if buffer_plus.geom_type == 'Polygon':
-        buffer_plus = MultiPolygon([buffer_plus])
+        # all done in order to avoid thin lines and other trashy geometries
+        # 2.1 combining all shapes into a single multipolygon
+        merged = components_union(polygons, tree)
 
-    # collect all parts of multipolygon
-    list_buff_plus = []
-    for buff in buffer_plus.geoms:
-        list_buff_plus.append(buff)
+        # squared positive buffer of multipolygon and squared negative buffer of its result,
+        # buffer output is already dissolved so no extra union is needed in between
+        buffer_minus = shapely.buffer(shapely.buffer(merged, buffer_tolerance, cap_style='square', join_style='mitre'),
+                                      buffer_tolerance * -1, cap_style='square', join_style='mitre')
 
-    # squared negative buffer of all buffers made in 2.1 with optional edits
-    plus_dissolve = unary_union(list_buff_plus)
-    buffer_minus = plus_dissolve.buffer(buffer_tolerance * -1, cap_style='square', join_style='mitre')
+        # collect single parts of result above as array
+        buffer_parts = shapely.get_parts(buffer_minus)
 
-    # convert result above to multipolygon is it is singlepart
-    if buffer_minus.geom_type == 'Polygon':
-        buffer_minus = MultiPolygon([buffer_minus])
+        cutters = cutters_future.result()
 
     # step 3, looping single parts of multipolygon
-    # looking for initial geometries which intersect buffer parts
-    for single_part in list(buffer_minus.geoms):
-        # get intersecting shapely polygons
-        intersecting_list = [p for p in polygon_data.keys() if p.intersects(single_part)]
-        pre_meshes_list = []
-        # loop intersecting polygons
-        for int_poly in intersecting_list:
-            # get data like unique height, unique z_level
-            hgt_extrusion = polygon_data[int_poly][0]
-            hgt_z_level = polygon_data[int_poly][1]
-
-            # making a mesh
-            mesh_cutter_geom = generate_union_mesh(int_poly, hgt_extrusion, hgt_z_level)
-            if mesh_cutter_geom:
-                pre_meshes_list.append(mesh_cutter_geom)
-
-        mesh = None
-        if pre_meshes_list:
-            # combining all meshes together
-            for i, cutter_mesh in enumerate(pre_meshes_list):
-                if i == 0:
-                    mesh = cutter_mesh
-                else:
-                    mesh_is_fine = False
-
-                    # shifting meshes in order to get an appropriate intersection which will not lead
-                    # to mesh geometry errors
-                    for shift in SHIFTS:
-                        cutter_mesh.apply_translation(shift)
-                        # cutter_mesh.apply_translation(tuple(map(lambda x: x * 2, shift)))
-                        new_mesh = mesh.union(cutter_mesh)
-                        if new_mesh.is_volume:
-                            mesh = new_mesh
-                            mesh_is_fine = True
-                            break
-                    if not mesh_is_fine:
-                        list_of_broken_meshes.append([cutter_mesh, ERRORS_LAYER])
-            list_of_meshes.append([mesh, MAIN_LAYER])
+    # looking for initial geometries which intersect buffer parts, all parts are queried at once
+    part_index, polygon_index = tree.query(buffer_parts, predicate='intersects')
 
-    return list_of_meshes, list_of_broken_meshes
+    # indices of intersecting shapely polygons grouped by part, keeping the order of input layer
+    order = np.lexsort((polygon_index, part_index))
+    groups = np.split(polygon_index[order], np.cumsum(np.bincount(part_index, minlength=len(buffer_parts)))[:-1])
+
+    # cluster data is sent to worker processes as wkb and float arrays, both are cheap to pickle
+    clusters = [(shapely.to_wkb(cutters[group]), heights[group], z_levels[group]) for group in groups]
 
+    # clusters are independent, so they are extruded and combined in parallel
+    if workers > 1 and len(clusters) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process_cluster, *zip(*clusters),
+                                        chunksize=max(1, len(clusters) // (workers * 4))))
+    else:
+        results = [process_cluster(*cluster) for cluster in clusters]
 
-def generate_union_mesh(polygon, height, z_level_value):
-    # extrude and collect meshes for a group of polygons
+    # collecting meshes back from arrays of vertices and faces
+    for mesh_arrays, broken_arrays in results:
+        if mesh_arrays:
+            list_of_meshes.append([trimesh.Trimesh(*mesh_arrays, process=False), MAIN_LAYER])
+        for broken_mesh_arrays in broken_arrays:
+            list_of_broken_meshes.append([trimesh.Trimesh(*broken_mesh_arrays, process=False), ERRORS_LAYER])
 
-    # making a small positive buffer
-    int_poly_buffer = polygon.buffer(buffer_tolerance, cap_style='flat', join_style='bevel')
+    return list_of_meshes, list_of_broken_meshes
 
-    # simplifying buffer to clean possible garbage
-    simplified_cutter = int_poly_buffer.simplify(tolerance=simplify_tolerance)
 
-    # check if polygon is object with lakes
-    if simplified_cutter.boundary.geom_type == 'MultiLineString':
+def make_cutters(polygons):
+    # cutters of all polygons at once: a small positive buffer, simplified to clean possible garbage
+
+    return shapely.simplify(
+        shapely.buffer(polygons, buffer_tolerance, cap_style='flat', join_style='bevel'), simplify_tolerance)
+
+
+def process_cluster(cutters_wkb, cluster_heights, cluster_z_levels):
+    # step 3.1, extrude polygons of a single cluster and combine them into one mesh
+    # returns vertices and faces of combined mesh and of meshes which failed to combine
+
+    pre_meshes_list = []
+    broken_meshes = []
+    # loop intersecting polygons
+    for int_cutter, hgt_extrusion, hgt_z_level in zip(shapely.from_wkb(cutters_wkb), cluster_heights, cluster_z_levels):
+        # making a mesh
+        mesh_cutter_geom = generate_union_mesh(int_cutter, hgt_extrusion, hgt_z_level)
+        if mesh_cutter_geom:
+            pre_meshes_list.append([mesh_cutter_geom, int_cutter])
+
+    # nothing to combine in empty cluster or in a cluster of a single polygon
+    if not pre_meshes_list:
+        return None, []
+    if len(pre_meshes_list) == 1:
+        return (pre_meshes_list[0][0].vertices, pre_meshes_list[0][0].faces), []
+
+    rng = np.random.default_rng(SHIFT_SEED)
+    # footprints of meshes combined so far, they are prepared as each one is tested against all next footprints
+    combined_cutters = []
+
+    # combining all meshes together
+    for i, (cutter_mesh, cutter_geom) in enumerate(pre_meshes_list):
+        shapely.prepare(combined_cutters)  # already prepared footprints are skipped
+        if i == 0:
+            mesh = cutter_mesh
+            combined_cutters.append(cutter_geom)
+        elif not shapely.intersects(combined_cutters, cutter_geom).any():
+            # footprint is apart from combined meshes, so solids can be joined without boolean union
+            mesh = trimesh.util.concatenate([mesh, cutter_mesh])
+            combined_cutters.append(cutter_geom)
+        else:
+            mesh_is_fine = False
+            shift = (0.0, 0.0, 0.0)
+
+            # combining mesh as it is first, then shifting it in random directions in order to get
+            # an appropriate intersection which will not lead to mesh geometry errors
+            for attempt in range(SHIFT_ATTEMPTS + 1):
+                if attempt:
+                    angle = rng.uniform(0.0, 2 * math.pi)
+                    shift = (SHIFT_DISTANCE * math.cos(angle), SHIFT_DISTANCE * math.sin(angle), 0.0)
+                    cutter_mesh.apply_translation(shift)
+                new_mesh = mesh.union(cutter_mesh, engine='manifold')
+                if new_mesh.is_volume:
+                    mesh = new_mesh
+                    mesh_is_fine = True
+                    combined_cutters.append(translate(cutter_geom, shift[0], shift[1]))
+                    break
+
+                # moving mesh back, so shifts do not add up
+                if attempt:
+                    cutter_mesh.apply_translation(tuple(-x for x in shift))
+            if not mesh_is_fine:
+                broken_meshes.append(cutter_mesh)
+
+    return (mesh.vertices, mesh.faces), [(m.vertices, m.faces) for m in broken_meshes]
+
+
+def generate_union_mesh(simplified_cutter, height, z_level_value):
+    # extrude and collect meshes for a group of polygons, cutter is a buffered and simplified polygon
+
+    # check if polygon is object with lakes, most of them are not, so they are extruded as they are
+    if not shapely.get_num_interior_rings(simplified_cutter):
+        p_cutter = simplified_cutter  # polygon which will be extruded
+    else:
         coords_cutter_main = []
         coords_cutter_holes = []
 
         # loop all parts and collect lakes
         for index_line, line in enumerate(simplified_cutter.boundary.geoms):
             if index_line:
-                line_hole = [list(f) for f in line.coords[:]]
-                coords_cutter_holes.append(line_hole)
+                coords_cutter_holes.append(np.asarray(line.coords))
             else:
-                coords_cutter_main = [list(f) for f in line.coords[:]]
+                coords_cutter_main = np.asarray(line.coords)
         p_cutter = Polygon(coords_cutter_main, coords_cutter_holes)  # polygon which will be extruded
-    else:
-        p_cutter = Polygon(simplified_cutter.boundary.coords[:], [])  # polygon which will be extruded
 
     # mesh extrusion
-    mesh_cutter = trimesh.creation.extrude_polygon(p_cutter, height)
-    if z_level_value:
-        mesh_cutter.apply_translation((0.0, 0.0, z_level_value))
+    mesh_cutter = extrude_prism(p_cutter, height, z_level_value)
 
     # return mesh if it is real
     if mesh_cutter:
         return mesh_cutter
 
 
+def extrude_prism(polygon, height, z_level_value):
+    # build watertight prism mesh from z-level up to z-level + height
+
+    # rings with counterclockwise outline and clockwise lakes, so material is on the left of every ring
+    exterior = np.asarray(polygon.exterior.coords)[:, :2]
+    rings = [exterior if is_ccw(exterior) else exterior[::-1]]
+    for interior in polygon.interiors:
+        hole = np.asarray(interior.coords)[:, :2]
+        rings.append(hole[::-1] if is_ccw(hole) else hole)
+
+    # ring coordinates without closing points
+    rings = [ring[:-1] for ring in rings]
+    ring_ends = np.cumsum([len(ring) for ring in rings])
+    vertices_2d = np.concatenate(rings)
+    count = len(vertices_2d)
+
+    # triangulate a cap, orient its triangles to look upwards
+    cap = triangulate_float64(vertices_2d, ring_ends.astype(np.uint32)).reshape((-1, 3)).astype(np.int64)
+    if not len(cap):
+        return None
+    edge_1 = vertices_2d[cap[:, 1]] - vertices_2d[cap[:, 0]]
+    edge_2 = vertices_2d[cap[:, 2]] - vertices_2d[cap[:, 0]]
+    if np.sum(edge_1[:, 0] * edge_2[:, 1] - edge_1[:, 1] * edge_2[:, 0]) < 0:
+        cap = cap[:, ::-1]
+
+    # walls: two triangles for every ring edge, bottom vertices go first and top ones are shifted by count
+    starts = np.arange(count)
+    ring_starts = np.r_[0, ring_ends[:-1]]
+    ends = np.concatenate([np.roll(np.arange(start, end), -1) for start, end in zip(ring_starts, ring_ends)])
+    walls = np.vstack((np.column_stack((starts, ends, ends + count)),
+                       np.column_stack((starts, ends + count, starts + count))))
+
+    vertices = np.vstack((np.column_stack((vertices_2d, np.full(count, z_level_value))),
+                          np.column_stack((vertices_2d, np.full(count, z_level_value + height)))))
+    faces = np.vstack((cap[:, ::-1], cap + count, walls))
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
 def dxf_create(mesh_list, mesh_list_corrupted):
     # step 4, dxf creation
     doc = ezdxf.new("R2000")
@@ -266,11 +382,12 @@ def dxf_create(mesh_list, mesh_list_corrupted):
     # loop mesh list and put them into cad model list
     for m_list in [mesh_list, mesh_list_corrupted]:
         for i, mesh_part in enumerate(m_list):
-            mesh_part[0].fix_normals()
+            # no normals fixing: prisms and their unions are already built with outward faces
             mesh = msp.add_mesh(dxfattribs=mesh_part[1])
             mesh.dxf.subdivision_levels = 0
             with mesh.edit_data() as mesh_data:
-                mesh_data.vertices = mesh_part[0].vertices.tolist()
+                # rounded coordinates are written as much shorter text
+                mesh_data.vertices = np.round(mesh_part[0].vertices, DXF_PRECISION).tolist()
                 mesh_data.faces = mesh_part[0].faces.tolist()
 
             if output_type != 'mesh':
@@ -283,11 +400,12 @@ def dxf_create(mesh_list, mesh_list_corrupted):
 
 
 def run():
-    polygon_data = data_collection(in_file)
-    meshes, meshes_corrupted = transform_to_mesh(polygon_data)
+    polygons, heights, z_levels = data_collection(in_file)
+    meshes, meshes_corrupted = transform_to_mesh(polygons, heights, z_levels)
     output = dxf_create(meshes, meshes_corrupted)
     return output
 
 
-result = run()
-print(result)
+if __name__ == '__main__':
+    result = run()
+    print(result)